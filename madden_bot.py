@@ -1,9 +1,14 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
+import asyncio
 import json
 import os
+from operator import itemgetter
+import brotli
+import orjson
 from info import DISCORD_TOKEN
-DATA_FILE = "league.json"
+DATA_FILE = "league.json.br"
+LEGACY_DATA_FILE = "league.json"  # pre-brotli format, read only if DATA_FILE is missing
 
 # --------------------
 # Data helpers
@@ -13,98 +18,37 @@ def normalize_team_name(name: str) -> str:
     # Allows case-insensitive matching and names with spaces if user quotes them.
     return name.strip()
 
-def head_to_head(data, team_a: str, team_b: str):
+def record_h2h(data, p1, s1, p2, s2):
     """
-    Returns (a_wins, b_wins, ties, a_pf, a_pa, games_played)
-    computed from data["games"] only (regular season history).
+    Folds one regular-season game into data["h2h"], the running
+    head-to-head table stored as data["h2h"][a][b], where a sorts before b
+    case-insensitively (the same rule as the seeding name tiebreak).
+    Each record is oriented to team "a".
     """
-    a = team_a
-    b = team_b
-
-    a_wins = b_wins = ties = 0
-    a_pf = a_pa = 0
-    played = 0
-
-    for g in data.get("games", []):
-        p1, s1, p2, s2 = g["p1"], g["s1"], g["p2"], g["s2"]
-
-        # Match regardless of ordering in the saved game
-        if {p1, p2} != {a, b}:
-            continue
-
-        played += 1
-
-        if p1 == a and p2 == b:
-            a_pf += s1
-            a_pa += s2
-            if s1 > s2:
-                a_wins += 1
-            elif s2 > s1:
-                b_wins += 1
-            else:
-                ties += 1
-        else:
-            # p1 == b and p2 == a
-            a_pf += s2
-            a_pa += s1
-            if s2 > s1:
-                a_wins += 1
-            elif s1 > s2:
-                b_wins += 1
-            else:
-                ties += 1
-
-    return a_wins, b_wins, ties, a_pf, a_pa, played
-
-from collections import defaultdict
-
-def top_h2h_by_winpct(data, limit=10, min_games=2):
-    stats = defaultdict(lambda: {
-        "games": 0,
-        "wins": defaultdict(int)
-    })
-
-    for g in data.get("games", []):
-        p1, p2 = g["p1"], g["p2"]
-        s1, s2 = g["s1"], g["s2"]
-
-        key = tuple(sorted([p1, p2]))
-        stats[key]["games"] += 1
-
-        if s1 > s2:
-            stats[key]["wins"][p1] += 1
-        elif s2 > s1:
-            stats[key]["wins"][p2] += 1
-
-    results = []
-
-    for (a, b), v in stats.items():
-        games = v["games"]
-        if games < min_games:
-            continue
-
-        a_wins = v["wins"][a]
-        b_wins = v["wins"][b]
-
-        if a_wins >= b_wins:
-            winner, loser = a, b
-            w_wins, l_wins = a_wins, b_wins
-        else:
-            winner, loser = b, a
-            w_wins, l_wins = b_wins, a_wins
+    if p1 == p2:
+        return
 
-        win_pct = w_wins / games
+    a, b = sorted((p1, p2), key=lambda t: (t.lower(), t))
+    row = data["h2h"].setdefault(a, {})
+    rec = row.get(b)
+    if rec is None:
+        rec = row[b] = {
+            "a": a, "b": b,
+            "a_wins": 0, "b_wins": 0, "ties": 0,
+            "a_pf": 0, "a_pa": 0, "played": 0
+        }
 
-        results.append({
-            "winner": winner,
-            "loser": loser,
-            "games": games,
-            "record": f"{w_wins}-{l_wins}",
-            "win_pct": win_pct
-        })
+    a_score, b_score = (s1, s2) if p1 == a else (s2, s1)
 
-    results.sort(key=lambda x: (-x["win_pct"], -x["games"]))
-    return results[:limit]
+    rec["played"] += 1
+    rec["a_pf"] += a_score
+    rec["a_pa"] += b_score
+    if a_score > b_score:
+        rec["a_wins"] += 1
+    elif b_score > a_score:
+        rec["b_wins"] += 1
+    else:
+        rec["ties"] += 1
 
 def win_pct(wins, losses):
     games = wins + losses
@@ -116,27 +60,42 @@ def point_diff(player):
     return player["points_for"] - player["points_against"]
 
 def load_data():
-    if not os.path.exists(DATA_FILE):
+    if os.path.exists(DATA_FILE):
+        with open(DATA_FILE, "rb") as f:
+            data = orjson.loads(brotli.decompress(f.read()))
+    elif os.path.exists(LEGACY_DATA_FILE):
+        with open(LEGACY_DATA_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
         return {
             "season": 1,
             "playoff_mode": False,
             "players": {},
             "games": [],
+            "h2h": {},
             "playoffs": {"bracket": None, "results": []}
         }
 
-    with open(DATA_FILE, "r") as f:
-        data = json.load(f)
-
     data.setdefault("season", 1)
     data.setdefault("playoff_mode", False)
     data.setdefault("playoffs", {"bracket": None, "results": []})
 
+    # Files written before the h2h table existed: rebuild it from the log.
+    if "h2h" not in data:
+        data["h2h"] = {}
+        for g in data["games"]:
+            record_h2h(data, g["p1"], g["s1"], g["p2"], g["s2"])
+
     return data
 
 def save_data(data):
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    # Write to a temp file and swap it in so a crash never leaves a torn file.
+    tmp = f"{DATA_FILE}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(brotli.compress(orjson.dumps(data), quality=4))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, DATA_FILE)
 
 def is_admin(ctx):
     return (
@@ -151,32 +110,112 @@ def is_admin(ctx):
 intents = discord.Intents.default()
 intents.message_content = True
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+class LeagueBot(commands.Bot):
+    async def setup_hook(self):
+        # Runs once before the gateway connects, so no command ever sees
+        # league_data unset.
+        self.league_data = await asyncio.to_thread(load_data)
+        self.playoff_remaining = unplayed_matchups(self.league_data)
+        flush_league.start()
+
+    async def close(self):
+        # Don't lose writes that haven't hit the periodic flush yet. stop()
+        # lets an in-flight flush finish under save_lock; cancel() would
+        # release the lock while its worker thread is still writing.
+        flush_league.stop()
+        try:
+            await flush_pending()
+        finally:
+            await super().close()
+
+bot = LeagueBot(command_prefix="!", intents=intents)
+bot.league_data = None  # parsed league data, loaded once in setup_hook
+bot.dirty = False       # set by commands; league.json is written by flush_league
+bot.seeds_cache = None  # sorted standings, see get_seeds
+bot.playoff_remaining = set()  # unplayed bracket games as frozensets
+save_lock = asyncio.Lock()
+
+async def flush_pending():
+    # Disk I/O runs in a worker thread so it never blocks the gateway heartbeat.
+    # league_data holds only JSON types, so orjson.dumps never calls back
+    # into Python and serializes the dict as one snapshot under the GIL.
+    async with save_lock:
+        if not bot.dirty or bot.league_data is None:
+            return
+
+        # Clear first so changes made during the write are picked up next time.
+        bot.dirty = False
+        try:
+            await asyncio.to_thread(save_data, bot.league_data)
+        except BaseException:
+            # Includes cancellation; the write may not have landed.
+            bot.dirty = True
+            raise
+
+@tasks.loop(seconds=5)
+async def flush_league():
+    await flush_pending()
 
 @bot.event
 async def on_ready():
     print(f"Logged in as {bot.user}")
 
+@bot.event
+async def on_command_error(ctx, error):
+    # The big table/bracket commands are rate limited per server.
+    if isinstance(error, commands.CommandOnCooldown):
+        await ctx.send(f"⏳ Slow down — try again in {error.retry_after:.1f}s.")
+        return
+    # Everything else gets discord.py's usual "Ignoring exception" logging.
+    await commands.Bot.on_command_error(bot, ctx, error)
+
 # --------------------
 # Seeding & playoff logic
 # --------------------
 
+def _recompute_seeds(data):
+    # Build each sort key once with win_pct/point_diff inlined.
+    rows = []
+    for team, s in data["players"].items():
+        wins, pf = s["wins"], s["points_for"]
+        games = wins + s["losses"]
+        rows.append((
+            team, s,
+            -(wins / games) if games else 0.0,        # win %
+            s["points_against"] - pf,                 # point diff
+            -pf,                                      # points for
+            team.lower()                              # name tiebreak
+        ))
+
+    rows.sort(key=itemgetter(2, 3, 4, 5))
+    return [(team, s) for team, s, *_ in rows]
+
 def get_seeds(data):
-    return sorted(
-        data["players"].items(),
-        key=lambda x: (
-            -win_pct(x[1]["wins"], x[1]["losses"]),   # win %
-            -point_diff(x[1]),                        # point diff
-            -x[1]["points_for"],                      # points for
-            x[0].lower()                              # name tiebreak
-        )
-    )
+    # The live league's (team, stats) list is cached; commands that change
+    # records reset it. Any other dict is sorted on the spot.
+    if data is not bot.league_data:
+        return _recompute_seeds(data)
+    if bot.seeds_cache is None:
+        bot.seeds_cache = _recompute_seeds(data)
+    return bot.seeds_cache
 
 
 def get_seed_map(data):
     seeds = get_seeds(data)
     return {team: idx + 1 for idx, (team, _) in enumerate(seeds)}
 
+_ROUND1_PAIRINGS = {}
+
+def round1_pairings(n):
+    """
+    Index pairs for n round-1 seeds, best vs worst inward:
+    (0, n-1), (1, n-2), ... Cached per field size.
+    """
+    pairs = _ROUND1_PAIRINGS.get(n)
+    if pairs is None:
+        pairs = _ROUND1_PAIRINGS[n] = tuple((i, n - 1 - i) for i in range(n // 2))
+    return pairs
+
 def generate_playoff_bracket(data):
     seeds = get_seeds(data)
     teams = [team for team, _ in seeds]
@@ -193,56 +232,70 @@ def generate_playoff_bracket(data):
 
     if n % 2 == 1:
         bracket["play_in"] = (remaining[-2], remaining[-1])
-        remaining = remaining[:-2]
-        remaining.append("Play-In Winner")
+        remaining = remaining[:-2] + ["Play-In Winner"]
 
-    while len(remaining) >= 2:
-        bracket["round1"].append(
-            (remaining.pop(0), remaining.pop(-1))
-        )
+    bracket["round1"] = [
+        (remaining[hi], remaining[lo])
+        for hi, lo in round1_pairings(len(remaining))
+    ]
 
     return bracket
 
+def playoff_matchups(bracket):
+    # Playable games in a bracket as a set of frozensets for O(1) lookups.
+    matchups = [bracket["play_in"]] + bracket["round1"]
+    return {frozenset(m) for m in matchups if m}
+
+def unplayed_matchups(data):
+    # Bracket games with no recorded result yet.
+    playoffs = data["playoffs"]
+    if not playoffs.get("bracket"):
+        return set()
+    played = {frozenset((r["p1"], r["p2"])) for r in playoffs["results"]}
+    return playoff_matchups(playoffs["bracket"]) - played
+
 def label(team, seed_map):
     if team == "Play-In Winner":
         return "PI WIN"
     return f"#{seed_map[team]} {team}"
 
 def render_ascii_bracket(bracket, seed_map):
-    def fmt(team):
-        if team == "Play-In Winner":
-            return "PI WIN"
-        return f"#{seed_map[team]} {team}"
-
     play_in = bracket["play_in"]
     r1 = bracket["round1"]
     byes = bracket["byes"]
 
+    # Every slot is a padded label, so build each team's cell once up front.
+    teams = set(byes)
+    teams.update(team for match in r1 for team in match)
+    if play_in:
+        teams.update(play_in)
+    cells = {team: f"{label(team, seed_map):<14}" for team in teams}
+
     lines = []
     lines.append("```")
     lines.append("PLAY-IN        ROUND 1            ROUND 2            SUPER BOWL")
     lines.append("----------------------------------------------------------------")
 
     if play_in:
-        lines.append(f"{fmt(play_in[0]):<14} ─┐")
+        lines.append(f"{cells[play_in[0]]} ─┐")
         lines.append(" " * 15 + "│")
-        lines.append(f"{fmt(play_in[1]):<14} ─┘")
+        lines.append(f"{cells[play_in[1]]} ─┘")
     else:
         lines.append("")
 
     lines.append("")
 
     for high, low in r1:
-        lines.append(" " * 10 + f"{fmt(high):<14} ────────────┐")
+        lines.append(" " * 10 + f"{cells[high]} ────────────┐")
         lines.append(" " * 28 + "│")
-        lines.append(" " * 10 + f"{fmt(low):<14} ────────────┘")
+        lines.append(" " * 10 + f"{cells[low]} ────────────┘")
         lines.append("")
 
-    lines.append(" " * 32 + f"{fmt(byes[0]):<14} ─────────┐")
+    lines.append(" " * 32 + f"{cells[byes[0]]} ─────────┐")
     lines.append(" " * 32 + "(reseeds here)")
     lines.append("")
 
-    lines.append(" " * 32 + f"{fmt(byes[1]):<14} ─────────┐")
+    lines.append(" " * 32 + f"{cells[byes[1]]} ─────────┐")
     lines.append(" " * 32 + "(reseeds here)")
     lines.append("")
 
@@ -257,7 +310,7 @@ def render_ascii_bracket(bracket, seed_map):
 
 @bot.command()
 async def addplayer(ctx, name: str):
-    data = load_data()
+    data = bot.league_data
     if name in data["players"]:
         await ctx.send(f"{name} already exists.")
         return
@@ -269,58 +322,69 @@ async def addplayer(ctx, name: str):
         "points_against": 0
     }
 
-    save_data(data)
+    bot.seeds_cache = None
+    bot.dirty = True
     await ctx.send(f"Added player: {name}")
 
 @bot.command()
 async def game(ctx, p1: str, s1: int, p2: str, s2: int):
-    data = load_data()
+    data = bot.league_data
 
     if data["playoff_mode"]:
-        await handle_playoff_game(ctx, data, p1, s1, p2, s2)
+        await handle_playoff_game(ctx, p1, s1, p2, s2)
         return
 
     if p1 not in data["players"] or p2 not in data["players"]:
         await ctx.send("Both players must exist.")
         return
 
-    data["players"][p1]["points_for"] += s1
-    data["players"][p1]["points_against"] += s2
-    data["players"][p2]["points_for"] += s2
-    data["players"][p2]["points_against"] += s1
+    pa = data["players"][p1]
+    pb = data["players"][p2]
+
+    pa["points_for"] += s1
+    pa["points_against"] += s2
+    pb["points_for"] += s2
+    pb["points_against"] += s1
 
     if s1 > s2:
-        data["players"][p1]["wins"] += 1
-        data["players"][p2]["losses"] += 1
+        pa["wins"] += 1
+        pb["losses"] += 1
     else:
-        data["players"][p2]["wins"] += 1
-        data["players"][p1]["losses"] += 1
+        pb["wins"] += 1
+        pa["losses"] += 1
 
     data["games"].append({
         "p1": p1, "s1": s1,
         "p2": p2, "s2": s2
     })
+    record_h2h(data, p1, s1, p2, s2)
 
-    save_data(data)
+    bot.seeds_cache = None
+    bot.dirty = True
     await ctx.send(f"Final: {p1} {s1} – {p2} {s2}")
 
-async def handle_playoff_game(ctx, data, p1, s1, p2, s2):
+async def handle_playoff_game(ctx, p1, s1, p2, s2):
+    # Works on the live league: the unplayed-matchup index lives on bot
+    # alongside bot.league_data, not inside the data dict.
+    data = bot.league_data
     bracket = data["playoffs"].get("bracket")
     if not bracket:
         await ctx.send("❌ Playoff bracket not initialized.")
         return
 
-    valid_games = []
-
-    if bracket["play_in"]:
-        valid_games.append(bracket["play_in"])
+    remaining = bot.playoff_remaining
+    matchup = frozenset((p1, p2))
 
-    valid_games.extend(bracket["round1"])
-
-    if not any({p1, p2} == {a, b} for a, b in valid_games):
-        await ctx.send("❌ Invalid playoff matchup.")
+    # Each bracket game can be recorded once.
+    if matchup not in remaining:
+        if matchup in playoff_matchups(bracket):
+            await ctx.send("❌ That playoff game has already been recorded.")
+        else:
+            await ctx.send("❌ Invalid playoff matchup.")
         return
 
+    remaining.remove(matchup)
+
     winner = p1 if s1 > s2 else p2
 
     data["playoffs"]["results"].append({
@@ -329,45 +393,41 @@ async def handle_playoff_game(ctx, data, p1, s1, p2, s2):
         "winner": winner
     })
 
-    save_data(data)
+    bot.dirty = True
     await ctx.send(f"🏆 Playoff Final: {p1} {s1} – {p2} {s2}")
 
 
 @bot.command(name="top_h2h")
+@commands.cooldown(1, 5, commands.BucketType.guild)
 async def top_h2h(ctx):
-    data = load_data()
-    teams = list(data["players"].keys())
+    data = bot.league_data
 
-    if len(teams) < 2:
+    if len(data["players"]) < 2:
         await ctx.send("❌ Not enough teams.")
         return
 
     results = []
 
-    for i in range(len(teams)):
-        for j in range(i + 1, len(teams)):
-            team_a = teams[i]
-            team_b = teams[j]
-
-            a_wins, b_wins, ties, a_pf, a_pa, played = head_to_head(
-                data, team_a, team_b
-            )
-
+    for row in data["h2h"].values():
+        for rec in row.values():
+            played = rec["played"]
             if played < 2:
                 continue  # minimum 2 games
 
+            a_wins, b_wins, ties = rec["a_wins"], rec["b_wins"], rec["ties"]
+
             if a_wins >= b_wins:
-                winner = team_a
-                loser = team_b
+                winner = rec["a"]
+                loser = rec["b"]
                 w_wins = a_wins
                 l_wins = b_wins
-                diff = a_pf - a_pa
+                diff = rec["a_pf"] - rec["a_pa"]
             else:
-                winner = team_b
-                loser = team_a
+                winner = rec["b"]
+                loser = rec["a"]
                 w_wins = b_wins
                 l_wins = a_wins
-                diff = a_pa - a_pf
+                diff = rec["a_pa"] - rec["a_pf"]
 
             winpct = w_wins / played
 
@@ -386,55 +446,58 @@ async def top_h2h(ctx):
 
     results.sort(key=lambda x: (-x["win_pct"], -abs(x["diff"])))
 
-    msg = "**Top Head-to-Head Matchups**\n"
-    msg += "_Winner listed first • minimum 2 games_\n"
-    msg += "```\n"
-    msg += f"{'RK':<3} {'MATCHUP':<28} {'GP':<3} {'REC':<8} {'PCT':<6} {'DIFF'}\n"
-    msg += "-" * 65 + "\n"
+    lines = []
+    lines.append("**Top Head-to-Head Matchups**")
+    lines.append("_Winner listed first • minimum 2 games_")
+    lines.append("```")
+    lines.append(f"{'RK':<3} {'MATCHUP':<28} {'GP':<3} {'REC':<8} {'PCT':<6} {'DIFF'}")
+    lines.append("-" * 65)
 
     for i, r in enumerate(results[:10], start=1):
         diff_str = f"+{r['diff']}" if r["diff"] > 0 else str(r["diff"])
         matchup = f"{r['winner']} vs {r['loser']}"
 
-        msg += (
+        lines.append(
             f"{i:<3} "
             f"{matchup:<28} "
             f"{r['games']:<3} "
             f"{r['record']:<8} "
             f"{r['win_pct']:.3f} "
-            f"{diff_str}\n"
+            f"{diff_str}"
         )
 
-    msg += "```"
-    await ctx.send(msg)
+    lines.append("```")
+    await ctx.send("\n".join(lines))
 
 @bot.command()
+@commands.cooldown(1, 5, commands.BucketType.guild)
 async def standings(ctx):
-    data = load_data()
+    data = bot.league_data
     table = get_seeds(data)
 
-    msg = "**Standings**\n"
-    msg += "```\n"
-    msg += f"{'RK':<3} {'TEAM':<12} {'REC':<7} {'PCT':<6} {'PF':<5} {'PA':<5} {'DIFF':<5}\n"
-    msg += "-" * 50 + "\n"
+    lines = []
+    lines.append("**Standings**")
+    lines.append("```")
+    lines.append(f"{'RK':<3} {'TEAM':<12} {'REC':<7} {'PCT':<6} {'PF':<5} {'PA':<5} {'DIFF':<5}")
+    lines.append("-" * 50)
 
     for idx, (team, s) in enumerate(table, start=1):
         pct = win_pct(s["wins"], s["losses"])
         diff = point_diff(s)
         diff_str = f"+{diff}" if diff > 0 else str(diff)
 
-        msg += (
+        lines.append(
             f"{idx:<3} "
             f"{team:<12} "
             f"{s['wins']}-{s['losses']:<7} "
             f"{pct:.3f} "
             f"{s['points_for']:<5} "
             f"{s['points_against']:<5} "
-            f"{diff_str:<5}\n"
+            f"{diff_str:<5}"
         )
 
-    msg += "```"
-    await ctx.send(msg)
+    lines.append("```")
+    await ctx.send("\n".join(lines))
 
 
 @bot.command()
@@ -443,7 +506,7 @@ async def resetseason(ctx):
         await ctx.send("❌ Only admins can reset the season.")
         return
 
-    data = load_data()
+    data = bot.league_data
 
     if data["playoff_mode"]:
         await ctx.send("❌ Cannot reset season during playoffs.")
@@ -453,9 +516,11 @@ async def resetseason(ctx):
         p.update({"wins": 0, "losses": 0, "points_for": 0, "points_against": 0})
 
     data["games"] = []
+    data["h2h"] = {}
     data["season"] += 1
 
-    save_data(data)
+    bot.seeds_cache = None
+    bot.dirty = True
     await ctx.send(f"✅ Season reset. Now starting **Season {data['season']}**.")
 
 @bot.command()
@@ -464,34 +529,43 @@ async def playoffmode(ctx):
         await ctx.send("❌ Only admins can start playoff mode.")
         return
 
-    data = load_data()
+    data = bot.league_data
 
     if data["playoff_mode"]:
         await ctx.send("❌ Playoffs already started.")
         return
 
+    bracket = generate_playoff_bracket(data)
+
     data["playoff_mode"] = True
     data["playoffs"] = {
-        "bracket": generate_playoff_bracket(data),
-        "results": []
+        "bracket": bracket,
+        "results": [],
+        "rendered": render_ascii_bracket(bracket, get_seed_map(data))
     }
+    bot.playoff_remaining = playoff_matchups(bracket)
 
-    save_data(data)
+    bot.dirty = True
     await ctx.send("🏈 **PLAYOFF MODE ACTIVATED**")
 
 @bot.command()
+@commands.cooldown(1, 5, commands.BucketType.guild)
 async def currentplayoff(ctx):
-    data = load_data()
+    data = bot.league_data
 
     if len(data["players"]) < 4:
         await ctx.send("❌ Need at least 4 players to generate a playoff bracket.")
         return
 
-    bracket = data["playoffs"]["bracket"] or generate_playoff_bracket(data)
-    seed_map = get_seed_map(data)
+    # playoffmode renders the locked bracket once; results don't change it.
+    rendered = data["playoffs"].get("rendered")
+
+    if rendered is None:
+        bracket = data["playoffs"]["bracket"] or generate_playoff_bracket(data)
+        rendered = render_ascii_bracket(bracket, get_seed_map(data))
 
     msg = "**🏈 CURRENT PLAYOFF BRACKET**\n\n"
-    msg += render_ascii_bracket(bracket, seed_map)
+    msg += rendered
 
     await ctx.send(msg)
 
@@ -517,7 +591,7 @@ def archive_season(data):
 
 @bot.command()
 async def removeplayer(ctx, name: str):
-    data = load_data()
+    data = bot.league_data
 
     if name not in data["players"]:
         await ctx.send(f"❌ Player `{name}` does not exist.")
@@ -525,7 +599,8 @@ async def removeplayer(ctx, name: str):
 
     player = data["players"][name]
 
-    # Check stat-based games
+    # Every recorded game adds a win or loss to both players, so zeroed stats
+    # mean the player has no game history either.
     if (
         player["wins"] != 0
         or player["losses"] != 0
@@ -537,17 +612,10 @@ async def removeplayer(ctx, name: str):
         )
         return
 
-    # Check game history explicitly
-    for g in data["games"]:
-        if g["p1"] == name or g["p2"] == name:
-            await ctx.send(
-                f"❌ Cannot remove `{name}` — they appear in game history."
-            )
-            return
-
     # Safe to remove
     del data["players"][name]
-    save_data(data)
+    bot.seeds_cache = None
+    bot.dirty = True
 
     await ctx.send(f"✅ Player `{name}` has been removed.")
 